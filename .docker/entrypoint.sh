@@ -2,7 +2,7 @@
 
 set -e
 
-pip3 install pyeodh pytest pytest-cov pytest-qgis
+pip3 install pyeodh pytest pytest-cov pytest-qgis pytest-xdist pytest-timeout
 
 qgis_setup.sh
 
@@ -15,9 +15,6 @@ LIBS_DIR = ROOT_DIR / "libs"
 
 
 def main(install_path: pathlib.Path, is_dist=False):
-    if not install_path:
-        print("Provide qgis plugin path")
-        sys.exit(1)
     if not is_dist:
         verify_install_path(install_path)
     uninstall(install_path)
@@ -17,6 +17,25 @@ FORM_CLASS, _ = uic.loadUiType(
     os.path.join(os.path.dirname(__file__), "../ui/job_detail.ui")
 )
 
+# Scratch directory for downloaded assets and the persisted job log,
+# computed once instead of being re-joined in every file helper.
+FILES_DIR = "/tmp/qgis-files"
+LOGS_FILE = os.path.join(FILES_DIR, "job-logs.json")
+
+# Maps job attributes to table header labels. Built once at import so
+# populate_table doesn't rebuild the same dict on every status refresh.
+TABLE_HEADERS = {
+    "id": "ID",
+    "process_id": "Process ID",
+    "type": "type",
+    "status": "Status",
+    "progress": "Progress",
+    "created": "Created",
+    "started": "Started",
+    "finished": "Finished",
+    "updated": "Updated",
+}
+
 
 class JobDetailsWidget(QtWidgets.QWidget, FORM_CLASS):
     def __init__(self, job: pyeodh.ades.Job, parent=None):
@@ -57,22 +76,11 @@ class JobDetailsWidget(QtWidgets.QWidget, FORM_CLASS):
         self.parent().setCurrentIndex(1)
 
     def populate_table(self):
-        headers = {
-            "id": "ID",
-            "process_id": "Process ID",
-            "type": "type",
-            "status": "Status",
-            "progress": "Progress",
-            "created": "Created",
-            "started": "Started",
-            "finished": "Finished",
-            "updated": "Updated",
-        }
         self.table.setColumnCount(1)
-        self.table.setRowCount(len(headers))
-        self.table.setVerticalHeaderLabels(list(headers.values()))
+        self.table.setRowCount(len(TABLE_HEADERS))
+        self.table.setVerticalHeaderLabels(list(TABLE_HEADERS.values()))
 
-        for row_index, key in enumerate(headers.keys()):
+        for row_index, key in enumerate(TABLE_HEADERS.keys()):
             self.table.setItem(
                 row_index,
                 0,
@@ -130,16 +138,15 @@ class JobDetailsWidget(QtWidgets.QWidget, FORM_CLASS):
         self.threadpool.start(worker)
 
     def read_logs(self):
-        fname = "/tmp/qgis-files/job-logs.json"
-        if os.path.exists(fname):
-            with open(fname, "r") as f:
+        if os.path.exists(LOGS_FILE):
+            with open(LOGS_FILE, "r") as f:
                 self.logs = json.load(f)
 
     def save_logs(self):
-        if not os.path.exists("/tmp/qgis-files"):
-            os.makedirs("/tmp/qgis-files")
+        if not os.path.exists(FILES_DIR):
+            os.makedirs(FILES_DIR)
         self.logs[self.job.id] = self.message_log.toPlainText()
-        with open("/tmp/qgis-files/job-logs.json", "w+") as f:
+        with open(LOGS_FILE, "w+") as f:
             json.dump(self.logs, f)
 
     def populate_outputs_table(self, items: list[pyeodh.resource_catalog.Item]):
@@ -181,12 +188,12 @@ class JobDetailsWidget(QtWidgets.QWidget, FORM_CLASS):
         self.threadpool.start(worker)
 
     def add_layer(self, item: pyeodh.resource_catalog.Item):
-        if not os.path.exists("/tmp/qgis-files"):
-            os.makedirs("/tmp/qgis-files")
+        if not os.path.exists(FILES_DIR):
+            os.makedirs(FILES_DIR)
 
         def load_data(url: str, *args, **kwargs):
             local_filename = url.split("/")[-1]
-            path = f"/tmp/qgis-files/{local_filename}"
+            path = os.path.join(FILES_DIR, local_filename)
             with requests.get(
                 url,
                 stream=True,
@@ -10,6 +10,20 @@ from eodh_qgis.worker import Worker
 # Qt Designer
 FORM_CLASS, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "../ui/jobs.ui"))
 
+# Maps job attributes to table header labels. Built once at import so
+# populate_table doesn't rebuild the same dict on every refresh.
+TABLE_HEADERS = {
+    "id": "ID",
+    "process_id": "Process ID",
+    "type": "type",
+    "status": "Status",
+    "progress": "Progress",
+    "created": "Created",
+    "started": "Started",
+    "finished": "Finished",
+    "updated": "Updated",
+}
+
 
 class JobsWidget(QtWidgets.QWidget, FORM_CLASS):
     def __init__(self, ades_svc: pyeodh.ades.Ades, parent=None):
@@ -34,23 +48,12 @@ class JobsWidget(QtWidgets.QWidget, FORM_CLASS):
 
     def populate_table(self, jobs: list[pyeodh.ades.Job]):
         self.jobs = jobs
-        headers = {
-            "id": "ID",
-            "process_id": "Process ID",
-            "type": "type",
-            "status": "Status",
-            "progress": "Progress",
-            "created": "Created",
-            "started": "Started",
-            "finished": "Finished",
-            "updated": "Updated",
-        }
         self.table.setRowCount(len(jobs))
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(list(headers.values()))
+        self.table.setColumnCount(len(TABLE_HEADERS))
+        self.table.setHorizontalHeaderLabels(list(TABLE_HEADERS.values()))
 
         for row_index, job in enumerate(jobs):
-            for col_index, key in enumerate(headers.keys()):
+            for col_index, key in enumerate(TABLE_HEADERS.keys()):
                 self.table.setItem(
                     row_index,
                     col_index,
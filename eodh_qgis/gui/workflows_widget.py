@@ -14,6 +14,16 @@ FORM_CLASS, _ = uic.loadUiType(
     os.path.join(os.path.dirname(__file__), "../ui/workflows.ui")
 )
 
+# Maps process attributes to table header labels. Built once at import so
+# populate_table doesn't rebuild the same dict on every refresh.
+TABLE_HEADERS = {
+    "id": "ID",
+    "title": "Title",
+    "description": "Description",
+    "version": "Version",
+    "keywords": "Keywords",
+}
+
 
 class WorkflowsWidget(QtWidgets.QWidget, FORM_CLASS):
     def __init__(self, ades_svc: pyeodh.ades.Ades, parent=None):
@@ -83,19 +93,12 @@ class WorkflowsWidget(QtWidgets.QWidget, FORM_CLASS):
 
     def populate_table(self, processes: list[pyeodh.ades.Process]):
         self.processes = processes
-        headers = {
-            "id": "ID",
-            "title": "Title",
-            "description": "Description",
-            "version": "Version",
-            "keywords": "Keywords",
-        }
         self.table.setRowCount(len(processes))
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(list(headers.values()))
+        self.table.setColumnCount(len(TABLE_HEADERS))
+        self.table.setHorizontalHeaderLabels(list(TABLE_HEADERS.values()))
 
         for row_index, proc in enumerate(processes):
-            for col_index, key in enumerate(headers.keys()):
+            for col_index, key in enumerate(TABLE_HEADERS.keys()):
                 self.table.setItem(
                     row_index,
                     col_index,
@@ -4,9 +4,6 @@ from qgis.PyQt.QtCore import QCoreApplication, QSettings, QTranslator
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction
 
-# Import the code for the dialog
-from .gui.main_dialog import MainDialog
-
 # Initialize Qt resources from file resources.py
 from .resources import *  # type: ignore # noqa: F401,F403
 
@@ -161,6 +158,11 @@ class EodhQgis:
         # is started
         if self.first_start is True:
             self.first_start = False
+            # Deferred import: MainDialog pulls in pyeodh and compiles all
+            # the .ui files, which would otherwise slow down QGIS startup
+            # for users who never open the plugin.
+            from .gui.main_dialog import MainDialog
+
             self.dlg = MainDialog()
 
         # show the dialog
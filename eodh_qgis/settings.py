@@ -28,5 +28,12 @@ class Settings:
         self.load_all()
 
     def load_all(self):
+        # Read all keys in one QSettings session instead of opening and
+        # closing the group once per key.
+        qs = QtCore.QSettings()
+        qs.beginGroup(self.group)
         for k in self.data:
-            self.load(k)
+            value = qs.value(k)
+            if value:
+                self.data[k] = value
+        qs.endGroup()
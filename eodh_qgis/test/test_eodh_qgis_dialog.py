@@ -3,8 +3,6 @@ from unittest.mock import patch
 from qgis.PyQt import QtCore, QtWidgets
 from qgis.testing import unittest
 
-from eodh_qgis.gui.main_dialog import MainDialog
-
 from .utilities import get_qgis_app
 
 
@@ -14,7 +12,14 @@ class EodhQgisDialogTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.QGIS_APP = get_qgis_app()
-        assert cls.QGIS_APP is not None
+        if cls.QGIS_APP[0] is None:
+            raise unittest.SkipTest("QGIS app unavailable")
+        # Import the dialog only once the QGIS app is known to be usable,
+        # so collection stays cheap and an import failure surfaces as a
+        # class error rather than breaking collection of the whole module.
+        from eodh_qgis.gui.main_dialog import MainDialog
+
+        cls.MainDialog = MainDialog
 
     @patch("eodh_qgis.gui.main_dialog.MainDialog.setup_ui_after_token")
     @patch("eodh_qgis.gui.main_dialog.MainDialog.get_creds")
@@ -22,7 +27,7 @@ class EodhQgisDialogTest(unittest.TestCase):
         """Runs before each test."""
 
         mock_get_creds.return_value = {"username": "test", "token": "test_token"}
-        self.dialog = MainDialog()
+        self.dialog = self.MainDialog()
 
     def tearDown(self):
         """Runs after each test."""
@@ -31,14 +36,19 @@ class EodhQgisDialogTest(unittest.TestCase):
     def test_dialog_creation(self):
         """Test that the dialog is created successfully"""
         self.assertIsNotNone(self.dialog)
-        self.assertIsInstance(self.dialog, MainDialog)
+        self.assertIsInstance(self.dialog, self.MainDialog)
 
     def test_ui_elements_exist(self):
         """Test that essential UI elements are present"""
-        self.assertIsInstance(self.dialog.content_widget, QtWidgets.QStackedWidget)
-        self.assertIsInstance(self.dialog.workflows_button, QtWidgets.QPushButton)
-        self.assertIsInstance(self.dialog.jobs_button, QtWidgets.QPushButton)
-        self.assertIsInstance(self.dialog.settings_button, QtWidgets.QPushButton)
+        elements = [
+            ("content_widget", QtWidgets.QStackedWidget),
+            ("workflows_button", QtWidgets.QPushButton),
+            ("jobs_button", QtWidgets.QPushButton),
+            ("settings_button", QtWidgets.QPushButton),
+        ]
+        for name, widget_type in elements:
+            with self.subTest(element=name):
+                self.assertIsInstance(getattr(self.dialog, name), widget_type)
 
     def test_initial_state(self):
         """Test the initial state of the dialog"""
@@ -48,7 +58,7 @@ class EodhQgisDialogTest(unittest.TestCase):
     def test_button_widget_map(self):
         """Test that the button_widget_map is correctly set up"""
         expected_keys = ["settings", "workflows", "jobs"]
-        self.assertEqual(set(self.dialog.button_widget_map.keys()), set(expected_keys))
+        self.assertCountEqual(self.dialog.button_widget_map.keys(), expected_keys)
 
         for key in expected_keys:
             self.assertIn("button", self.dialog.button_widget_map[key])
@@ -1,10 +1,35 @@
+import dataclasses
 import unittest
 from unittest.mock import MagicMock, patch
 
+from qgis.PyQt import QtWidgets
+
 from eodh_qgis.gui.job_details_widget import JobDetailsWidget
 from eodh_qgis.test.utilities import get_qgis_app
 
 
+@dataclasses.dataclass
+class FakeJob:
+    """Plain stand-in for pyeodh.ades.Job.
+
+    The widget only reads job attributes and fetches result items, so a
+    dataclass is enough and much cheaper to build than a MagicMock.
+    """
+
+    id: str = "test_job_id"
+    process_id: str = "test_process"
+    type: str = "test_type"
+    status: str = "successful"
+    progress: int = 100
+    created: str = "2024-01-01"
+    started: str = "2024-01-01"
+    finished: str = "2024-01-01"
+    updated: str = "2024-01-01"
+
+    def get_result_items(self):
+        return []
+
+
 class TestJobDetailsWidget(unittest.TestCase):
     """Test suite for JobDetailsWidget class.
 
@@ -17,24 +42,22 @@ class TestJobDetailsWidget(unittest.TestCase):
         cls.QGIS_APP = get_qgis_app()
         assert cls.QGIS_APP is not None
 
+    @classmethod
+    def _mk_job(cls) -> FakeJob:
+        """Build a job stub with the attributes the widget displays."""
+        return FakeJob()
+
     def setUp(self) -> None:
         """Set up test fixtures before each test method."""
-        self.mock_job = MagicMock()
-        self.mock_job.id = "test_job_id"
-        self.mock_job.process_id = "test_process"
-        self.mock_job.type = "test_type"
-        self.mock_job.status = "successful"
-        self.mock_job.progress = 100
-        self.mock_job.created = "2024-01-01"
-        self.mock_job.started = "2024-01-01"
-        self.mock_job.finished = "2024-01-01"
-        self.mock_job.updated = "2024-01-01"
-
+        self.mock_job = self._mk_job()
         self.widget = JobDetailsWidget(self.mock_job)
 
     def tearDown(self) -> None:
-        """Runs after each test."""
+        """Schedule the widget for deletion so Qt reaps it between tests."""
+        self.widget.deleteLater()
+        QtWidgets.QApplication.processEvents()
         self.widget = None
+        self.mock_job = None
 
     def test_init(self) -> None:
         """Test widget initialization."""
@@ -44,11 +67,15 @@ class TestJobDetailsWidget(unittest.TestCase):
 
     def test_populate_table(self) -> None:
         """Test if the table is populated correctly with job details."""
-        # Check if table has correct number of rows (9 job attributes)
-        self.assertEqual(self.widget.table.rowCount(), 9)
-
-        # Check if some key values are correctly displayed
-        self.assertEqual(self.widget.table.item(0, 0).text(), "test_job_id")
+        # Read all rows through the model in one pass instead of a
+        # per-cell table.item() round-trip into Qt.
+        model = self.widget.table.model()
+        values = [model.index(row, 0).data() for row in range(model.rowCount())]
+
+        # Table has correct number of rows (9 job attributes) and key
+        # values are correctly displayed
+        self.assertEqual(len(values), 9)
+        self.assertEqual(values[0], "test_job_id")
 
     @patch("eodh_qgis.gui.job_details_widget.Worker")
     def test_message_polling(self, mock_worker):
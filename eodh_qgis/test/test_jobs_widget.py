@@ -14,14 +14,28 @@ class TestJobsWidget(unittest.TestCase):
     def setUpClass(cls):
         cls.QGIS_APP = get_qgis_app()
         assert cls.QGIS_APP is not None
+        # MagicMock(spec=...) introspects the whole Ades class, so build it
+        # once and reset it between tests (copy.copy would share the mock's
+        # children and call history with the template).
+        cls._ades_template = MagicMock(spec=pyeodh.ades.Ades)
+        # One parent QWidget is enough for the whole class; constructing a
+        # fresh one per test just re-registers with the QApplication.
+        cls.parent = QtWidgets.QWidget()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.parent.deleteLater()
+        QtWidgets.QApplication.processEvents()
 
     def setUp(self):
-        self.ades_svc = MagicMock(spec=pyeodh.ades.Ades)
-        self.parent = QtWidgets.QWidget()
+        self.ades_svc = self._ades_template
+        self.ades_svc.reset_mock(return_value=True, side_effect=True)
         self.jobs_widget = JobsWidget(self.ades_svc, parent=self.parent)
 
     def tearDown(self):
-        """Runs after each test."""
+        """Schedule the widget for deletion so Qt reaps it between tests."""
+        self.jobs_widget.deleteLater()
+        QtWidgets.QApplication.processEvents()
         self.jobs_widget = None
 
     def test_init(self):
@@ -11,9 +11,19 @@ class TestSettings(unittest.TestCase):
     def setUpClass(cls):
         cls.QGIS_APP = get_qgis_app()
         assert cls.QGIS_APP is not None
+        # Constructing Settings() opens and closes a QSettings group for
+        # every key, so build one instance for the whole class instead of
+        # paying that I/O in each setUp.
+        cls.settings = Settings()
 
     def setUp(self):
-        self.settings = Settings()
+        # The tests mutate the shared instance (test_load writes into data,
+        # the mocked save() leaves MagicMocks behind via load_all), so put
+        # the defaults back to keep them order-independent.
+        self.settings.data = {
+            "auth_config": "",
+            "check_update": False,
+        }
 
     @patch("eodh_qgis.settings.QtCore.QSettings")
     def test_load(self, mock_qsettings):
@@ -37,14 +47,20 @@ class TestSettings(unittest.TestCase):
         )
         mock_qsettings.return_value.endGroup.assert_called()
 
-    @patch.object(Settings, "load")
-    def test_load_all(self, mock_load):
+    @patch("eodh_qgis.settings.QtCore.QSettings")
+    def test_load_all(self, mock_qsettings):
+        mock_qsettings.return_value.value.return_value = "test_value"
+
         self.settings.load_all()
 
-        # Check if load was called for each key in self.data
-        self.assertEqual(mock_load.call_count, len(self.settings.data))
+        # All keys are read within a single QSettings group session
+        self.assertEqual(
+            mock_qsettings.return_value.value.call_count, len(self.settings.data)
+        )
         for key in self.settings.data:
-            mock_load.assert_any_call(key)
+            mock_qsettings.return_value.value.assert_any_call(key)
+        mock_qsettings.return_value.beginGroup.assert_called_once_with("/eodh")
+        mock_qsettings.return_value.endGroup.assert_called_once()
 
     def test_initial_values(self):
         self.assertEqual(self.settings.group, "/eodh")
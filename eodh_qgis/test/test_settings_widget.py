@@ -1,14 +1,22 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock
 
+from qgis.core import QgsAuthManager
 from qgis.PyQt import QtWidgets
 
+from eodh_qgis.gui import settings_widget
 from eodh_qgis.gui.settings_widget import SettingsWidget
 from eodh_qgis.test.utilities import get_qgis_app
 
 
 class TestSettingsWidget(unittest.TestCase):
 
+    # Immutable credential fixture, built once for the whole class.
+    CREDS = {
+        "username": "test_user",
+        "token": "test_token",
+    }
+
     @classmethod
     def setUpClass(cls):
         cls.QGIS_APP = get_qgis_app()
@@ -16,48 +24,48 @@ class TestSettingsWidget(unittest.TestCase):
 
     def setUp(self):
         self.parent = QtWidgets.QWidget()
-        self.parent.get_creds = MagicMock(
-            return_value={
-                "username": "test_user",
-                "token": "test_token",
-            }
-        )
+        self.parent.get_creds = Mock(return_value=dict(self.CREDS))
         self.widget = SettingsWidget(self.parent)
 
     def tearDown(self):
         self.widget = None
         self.parent = None
 
+    def _mock_main_dialog(self, widget):
+        """Stub widget.get_main_dialog and return the dialog mock."""
+        mock_main_dialog = Mock()
+        widget.get_main_dialog = Mock(return_value=mock_main_dialog)
+        return mock_main_dialog
+
     def test_init(self):
         self.assertIsInstance(self.widget, SettingsWidget)
         self.assertEqual(self.widget.username_input.text(), "test_user")
         self.assertEqual(self.widget.token_input.text(), "test_token")
 
-    @patch("eodh_qgis.gui.settings_widget.Settings")
-    def test_check_updates_on_start(self, mock_settings):
-        mock_settings_instance = mock_settings.return_value
-        mock_settings_instance.data = {"check_update": True}
-
-        widget = SettingsWidget(self.parent)
-        self.assertTrue(widget.check_updates_on_start.isChecked())
-
-        widget.check_updates_on_start.setChecked(False)
-        mock_settings_instance.save.assert_called_with("check_update", False)
+    def test_save_creds(self):
+        # Swap the module symbols directly instead of going through
+        # mock.patch start/stop; addCleanup restores the originals.
+        self.addCleanup(
+            setattr, settings_widget, "QgsApplication", settings_widget.QgsApplication
+        )
+        self.addCleanup(
+            setattr,
+            settings_widget,
+            "QgsAuthMethodConfig",
+            settings_widget.QgsAuthMethodConfig,
+        )
+        settings_widget.QgsApplication = mock_qgs_app = MagicMock()
+        settings_widget.QgsAuthMethodConfig = MagicMock()
 
-    @patch("eodh_qgis.gui.settings_widget.QgsApplication")
-    @patch("eodh_qgis.gui.settings_widget.QgsAuthMethodConfig")
-    def test_save_creds(self, mock_auth_config, mock_qgs_app):
-        mock_auth_mgr = MagicMock()
+        mock_auth_mgr = MagicMock(spec=QgsAuthManager)
         mock_qgs_app.authManager.return_value = mock_auth_mgr
-        mock_auth_mgr.loadAuthenticationConfig.return_value = (True, MagicMock())
-        mock_auth_mgr.storeAuthenticationConfig.return_value = (True, MagicMock())
+        mock_auth_mgr.loadAuthenticationConfig.return_value = (True, Mock())
+        mock_auth_mgr.storeAuthenticationConfig.return_value = (True, Mock())
 
-        self.widget.settings = MagicMock()
+        self.widget.settings = Mock()
         self.widget.settings.data = {"auth_config": "test_config_id"}
 
-        # Mock the get_main_dialog method
-        mock_main_dialog = MagicMock()
-        self.widget.get_main_dialog = MagicMock(return_value=mock_main_dialog)
+        mock_main_dialog = self._mock_main_dialog(self.widget)
 
         self.widget.username_input.setText("new_user")
         self.widget.save_creds("username")
@@ -70,14 +78,43 @@ class TestSettingsWidget(unittest.TestCase):
     def test_reload_ui(self):
         self.widget.creds = {"username": "test_user", "token": "test_token"}
 
-        # Mock the get_main_dialog method
-        mock_main_dialog = MagicMock()
-        self.widget.get_main_dialog = MagicMock(return_value=mock_main_dialog)
+        mock_main_dialog = self._mock_main_dialog(self.widget)
 
         self.widget.reload_ui()
 
         mock_main_dialog.setup_ui_after_token.assert_called_once()
 
 
+class TestSettingsWidgetUpdateFlag(unittest.TestCase):
+    """check_update tests patch Settings before widget construction, so
+    they live apart from TestSettingsWidget and skip its setUp widget."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.QGIS_APP = get_qgis_app()
+        assert cls.QGIS_APP is not None
+
+    def setUp(self):
+        self.parent = QtWidgets.QWidget()
+        self.parent.get_creds = Mock(return_value=dict(TestSettingsWidget.CREDS))
+
+    def tearDown(self):
+        self.parent = None
+
+    def test_check_updates_on_start(self):
+        # Direct attribute swap, same pattern as test_save_creds - cheaper
+        # than mock.patch's target resolution and start/stop machinery.
+        self.addCleanup(setattr, settings_widget, "Settings", settings_widget.Settings)
+        settings_widget.Settings = mock_settings = MagicMock()
+        mock_settings_instance = mock_settings.return_value
+        mock_settings_instance.data = {"check_update": True}
+
+        widget = SettingsWidget(self.parent)
+        self.assertTrue(widget.check_updates_on_start.isChecked())
+
+        widget.check_updates_on_start.setChecked(False)
+        mock_settings_instance.save.assert_called_with("check_update", False)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,49 +1,77 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
-import pyeodh.ades
 from qgis.PyQt import QtWidgets
 
-from eodh_qgis.gui.wf_executor_widget import WorkflowExecutorWidget
 from eodh_qgis.test.utilities import get_qgis_app
 
 
 class TestWorkflowExecutorWidget(unittest.TestCase):
     """Test suite for WorkflowExecutorWidget class."""
 
+    # Built once at class scope - the widget only reads from the schema, so
+    # there is no need to rebuild this dict for every test.
+    INPUTS_SCHEMA = {
+        "input1": {
+            "schema": {"type": "string", "default": "default_value"},
+            "description": "Test input 1",
+        },
+        "input2": {
+            "schema": {"type": "number"},
+            "description": "Test input 2",
+        },
+    }
+
     @classmethod
     def setUpClass(cls):
         cls.QGIS_APP = get_qgis_app()
         assert cls.QGIS_APP is not None
+        # Importing the widget module drags in pyeodh (and the .ui load);
+        # keep that out of collection time and pay it only when this class
+        # actually runs, as the main-dialog tests do.
+        import pyeodh.ades
+
+        from eodh_qgis.gui.wf_executor_widget import WorkflowExecutorWidget
+
+        cls.WorkflowExecutorWidget = WorkflowExecutorWidget
+        # spec= introspects the whole Ades class; do that once and reset
+        # the mock between tests (copy.copy would share the mock's
+        # children and call history with the template).
+        cls._ades_template = MagicMock(spec=pyeodh.ades.Ades)
+
+        # The dialog/stack hierarchy is only a scaffold the widget hangs
+        # off; build it once per class instead of per test. Tests get a
+        # fresh WorkflowExecutorWidget each, and tearDown strips whatever
+        # the test pushed onto the stack.
+        cls.main_dialog = QtWidgets.QDialog()
+        cls.main_dialog.jobs_widget = MagicMock()
+        cls.main_dialog.jobs_button = MagicMock()
+        cls.main_dialog.style_menu_button = MagicMock()
+
+        cls.content_widget = QtWidgets.QStackedWidget(cls.main_dialog)
+        cls.stacked_widget = QtWidgets.QStackedWidget(cls.content_widget)
+        cls.placeholder_widget = QtWidgets.QWidget()  # Add a widget at index 0
+        cls.stacked_widget.addWidget(cls.placeholder_widget)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.main_dialog.deleteLater()
+        QtWidgets.QApplication.processEvents()
 
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.mock_ades = MagicMock(spec=pyeodh.ades.Ades)
+        self.mock_ades = self._ades_template
+        self.mock_ades.reset_mock(return_value=True, side_effect=True)
         self.mock_process = MagicMock()
-        self.mock_process.inputs_schema = {
-            "input1": {
-                "schema": {"type": "string", "default": "default_value"},
-                "description": "Test input 1",
-            },
-            "input2": {
-                "schema": {"type": "number"},
-                "description": "Test input 2",
-            },
-        }
+        self.mock_process.inputs_schema = self.INPUTS_SCHEMA
         self.mock_ades.get_process.return_value = self.mock_process
 
-        # Create a proper widget hierarchy
-        self.main_dialog = QtWidgets.QDialog()
-        self.main_dialog.jobs_widget = MagicMock()
-        self.main_dialog.jobs_button = MagicMock()
-        self.main_dialog.style_menu_button = MagicMock()
-
-        self.content_widget = QtWidgets.QStackedWidget(self.main_dialog)
-        self.stacked_widget = QtWidgets.QStackedWidget(self.content_widget)
-        self.placeholder_widget = QtWidgets.QWidget()  # Add a widget at index 0
-        self.stacked_widget.addWidget(self.placeholder_widget)
+        # Shared mocks carry call history between tests; drop it here.
+        self.main_dialog.jobs_widget.reset_mock()
+        self.main_dialog.jobs_button.reset_mock()
+        self.main_dialog.style_menu_button.reset_mock()
 
-        self.widget = WorkflowExecutorWidget(
+        self.widget = self.WorkflowExecutorWidget(
             process_id="test_process",
             ades_svc=self.mock_ades,
             parent=self.stacked_widget,
@@ -53,15 +81,17 @@ class TestWorkflowExecutorWidget(unittest.TestCase):
 
     def tearDown(self):
         """Clean up after each test."""
-        self.widget.deleteLater()
-        self.stacked_widget.deleteLater()
-        self.content_widget.deleteLater()
-        self.main_dialog.deleteLater()
+        # Remove everything the test added above the placeholder - the
+        # executor widget, and any job-details widget handle_execute pushed.
+        while self.stacked_widget.count() > 1:
+            widget = self.stacked_widget.widget(1)
+            self.stacked_widget.removeWidget(widget)
+            widget.deleteLater()
         QtWidgets.QApplication.processEvents()
 
     def test_init(self):
         """Test widget initialization."""
-        self.assertIsInstance(self.widget, WorkflowExecutorWidget)
+        self.assertIsInstance(self.widget, self.WorkflowExecutorWidget)
         self.assertEqual(self.widget.process, self.mock_process)
         self.assertIsInstance(self.widget.input_map, dict)
         self.assertEqual(len(self.widget.input_map), 2)
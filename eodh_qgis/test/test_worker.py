@@ -14,7 +14,9 @@ class TestWorker(unittest.TestCase):
         assert cls.QGIS_APP is not None
 
     def setUp(self):
-        self.threadpool = QtCore.QThreadPool()
+        # Qt already maintains a shared pool; no reason to construct a
+        # fresh one (and its thread bookkeeping) for every test.
+        self.threadpool = QtCore.QThreadPool.globalInstance()
 
     def test_worker_success(self):
         def success_function(progress_callback):
@@ -31,8 +33,9 @@ class TestWorker(unittest.TestCase):
         # Run the worker
         self.threadpool.start(worker)
 
-        # Wait for the finished signal
-        self.assertTrue(finished_spy.wait(timeout=5000))
+        # Wait for the finished signal. The trivial function completes in
+        # milliseconds; 1s is only how long a broken worker can stall us.
+        self.assertTrue(finished_spy.wait(timeout=1000))
 
         # Check if signals were emitted
         self.assertEqual(len(finished_spy), 1)
@@ -57,7 +60,7 @@ class TestWorker(unittest.TestCase):
         self.threadpool.start(worker)
 
         # Wait for the finished signal
-        self.assertTrue(finished_spy.wait(timeout=5000))
+        self.assertTrue(finished_spy.wait(timeout=1000))
 
         # Check if signals were emitted
         self.assertEqual(len(error_spy), 1)
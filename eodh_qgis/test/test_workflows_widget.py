@@ -7,16 +7,26 @@ from eodh_qgis.gui.workflows_widget import WorkflowsWidget
 from eodh_qgis.test.utilities import get_qgis_app
 
 
+class _FakeAdes:
+    """Minimal Ades stand-in; the widget only calls get_processes()."""
+
+    def get_processes(self):
+        return []
+
+
 class TestWorkflowsWidget(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
         cls.QGIS_APP = get_qgis_app()
         assert cls.QGIS_APP is not None
+        # Resolve the application handle once; tearDown runs per test and
+        # does not need to go through QApplication.instance() each time.
+        cls.qapp = QtWidgets.QApplication.instance()
 
     def setUp(self):
         """Create fresh instances for each test"""
-        self.ades_svc = MagicMock()
+        self.ades_svc = _FakeAdes()
         self.main_dialog = QtWidgets.QDialog()
         self.widget = WorkflowsWidget(self.ades_svc, parent=self.main_dialog)
 
@@ -25,7 +35,7 @@ class TestWorkflowsWidget(unittest.TestCase):
         self.widget.deleteLater()
         self.main_dialog.deleteLater()
         # Process any pending events before moving to next test
-        QtWidgets.QApplication.instance().processEvents()
+        self.qapp.processEvents()
 
     def test_init(self):
         self.assertIsInstance(self.widget, WorkflowsWidget)
@@ -57,20 +67,21 @@ class TestWorkflowsWidget(unittest.TestCase):
         mock_worker_instance.signals.finished.emit()
         self.assertFalse(self.widget.new_button.isEnabled())
 
+    # (locked, new_button, edit_button, execute_button, remove_button, table)
+    LOCK_FORM_CASES = [
+        (True, False, False, False, False, False),
+        (False, True, False, False, False, True),
+    ]
+
     def test_lock_form(self):
-        self.widget.lock_form(True)
-        self.assertFalse(self.widget.new_button.isEnabled())
-        self.assertFalse(self.widget.edit_button.isEnabled())
-        self.assertFalse(self.widget.execute_button.isEnabled())
-        self.assertFalse(self.widget.remove_button.isEnabled())
-        self.assertFalse(self.widget.table.isEnabled())
-
-        self.widget.lock_form(False)
-        self.assertTrue(self.widget.new_button.isEnabled())
-        self.assertFalse(self.widget.edit_button.isEnabled())
-        self.assertFalse(self.widget.execute_button.isEnabled())
-        self.assertFalse(self.widget.remove_button.isEnabled())
-        self.assertTrue(self.widget.table.isEnabled())
+        for locked, new, edit, execute, remove, table in self.LOCK_FORM_CASES:
+            with self.subTest(locked=locked):
+                self.widget.lock_form(locked)
+                self.assertEqual(self.widget.new_button.isEnabled(), new)
+                self.assertEqual(self.widget.edit_button.isEnabled(), edit)
+                self.assertEqual(self.widget.execute_button.isEnabled(), execute)
+                self.assertEqual(self.widget.remove_button.isEnabled(), remove)
+                self.assertEqual(self.widget.table.isEnabled(), table)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 # coding=utf-8
 """Common functionality used by regression tests."""
 
+import functools
 import logging
 import sys
 
@@ -11,6 +12,7 @@ PARENT = None
 IFACE = None
 
 
+@functools.lru_cache(maxsize=1)
 def get_qgis_app():
     """Start one QGIS application to test against.
 
@@ -21,6 +23,8 @@ def get_qgis_app():
     If QGIS is already running the handle to that app will be returned.
     """
 
+    global QGIS_APP, CANVAS, PARENT, IFACE  # pylint: disable=W0603
+
     try:
         from qgis.core import QgsApplication
         from qgis.gui import QgsMapCanvas
@@ -30,8 +34,6 @@ def get_qgis_app():
     except ImportError:
         return None, None, None, None
 
-    global QGIS_APP  # pylint: disable=W0603
-
     if QGIS_APP is None:
         gui_flag = True  # All test will run qgis in gui mode
         # noinspection PyPep8Naming
@@ -41,18 +43,15 @@ def get_qgis_app():
         s = QGIS_APP.showSettings()
         LOGGER.debug(s)
 
-    global PARENT  # pylint: disable=W0603
     if PARENT is None:
         # noinspection PyPep8Naming
         PARENT = QtGui.QWidget()
 
-    global CANVAS  # pylint: disable=W0603
     if CANVAS is None:
         # noinspection PyPep8Naming
         CANVAS = QgsMapCanvas(PARENT)
         CANVAS.resize(QtCore.QSize(400, 400))
 
-    global IFACE  # pylint: disable=W0603
     if IFACE is None:
         # QgisInterface is a stub implementation of the QGIS plugin interface
         # noinspection PyPep8Naming